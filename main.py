@@ -7,19 +7,16 @@ Orchestrates the entire digest generation process
 import os
 import sys
 import logging
+import random
 import yaml
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from fetchers import HatenaFetcher, HackerNewsFetcher, RedditFetcher
-from summarizer import AISummarizer
-from html_generator import HTMLGenerator
-from archive_manager import ArchiveManager
-
 
 # Configure logging
 logging.basicConfig(
@@ -44,6 +41,27 @@ class DigestGenerator:
             config_path: Path to configuration file
         """
         self.config = self._load_config(config_path)
+
+        # Resolve per-section settings once
+        sources = self.config['sources']
+        self.hatena_config = sources['hatena']
+        self.hackernews_config = sources['hackernews']
+        self.reddit_config = sources['reddit']
+        self.ai_config = self.config['ai']
+        self.archive_config = self.config.get('archive', {})
+        self.cache_config = self.config.get('cache', {})
+
+        # A config typo here would fail every API request, and the summary
+        # step retries and then falls back, so reject it before fetching
+        from summarizer import PROMPT_CACHE_TTLS
+
+        prompt_cache_ttl = self.ai_config.get('prompt_cache_ttl', '5m')
+        if prompt_cache_ttl not in PROMPT_CACHE_TTLS:
+            raise ValueError(
+                f"ai.prompt_cache_ttl must be one of {', '.join(PROMPT_CACHE_TTLS)}, "
+                f"got {prompt_cache_ttl!r}"
+            )
+
         self.max_retries = 3
         self.retry_delay = 5  # seconds
 
@@ -52,10 +70,10 @@ class DigestGenerator:
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
                 config = yaml.safe_load(f)
-            logger.info(f"Loaded configuration from {config_path}")
+            logger.info("Loaded configuration from %s", config_path)
             return config
         except Exception as e:
-            logger.error(f"Error loading configuration: {e}")
+            logger.error("Error loading configuration: %s", e)
             raise
 
     def fetch_articles_with_retry(self) -> List[Dict[str, Any]]:
@@ -67,59 +85,70 @@ class DigestGenerator:
         """
         all_articles = []
 
-        # Fetch from Hatena Bookmark
-        if self.config['sources']['hatena']['enabled']:
-            articles = self._retry_operation(
-                self._fetch_hatena,
-                "Hatena Bookmark"
-            )
-            all_articles.extend(articles)
-
-        # Fetch from Hacker News
-        if self.config['sources']['hackernews']['enabled']:
-            articles = self._retry_operation(
-                self._fetch_hackernews,
-                "Hacker News"
-            )
-            all_articles.extend(articles)
-
-        # Fetch from Reddit
-        if self.config['sources']['reddit']['enabled']:
-            articles = self._retry_operation(
-                self._fetch_reddit,
-                "Reddit"
-            )
-            all_articles.extend(articles)
-
-        logger.info(f"Total articles fetched: {len(all_articles)}")
+        # Sources hit independent hosts, so fetch them concurrently
+        tasks = []
+        if self.hatena_config['enabled']:
+            tasks.append((self._fetch_hatena, "Hatena Bookmark"))
+        if self.hackernews_config['enabled']:
+            tasks.append((self._fetch_hackernews, "Hacker News"))
+        if self.reddit_config['enabled']:
+            tasks.append((self._fetch_reddit, "Reddit"))
+
+        if tasks:
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = [
+                    executor.submit(self._retry_operation, operation, name)
+                    for operation, name in tasks
+                ]
+                # Collect in submission order to keep source ordering stable
+                for future in futures:
+                    all_articles.extend(future.result())
+
+        logger.info("Total articles fetched: %s", len(all_articles))
         return all_articles
 
     def _fetch_hatena(self) -> List[Dict[str, Any]]:
         """Fetch articles from Hatena Bookmark"""
+        # Pipeline modules (and their SDK dependencies) are imported where they
+        # are used, so env validation and early exits don't pay for loading them
+        from fetchers.hatena_fetcher import HatenaFetcher
+
         fetcher = HatenaFetcher(
-            popular_count=self.config['sources']['hatena']['popular_count'],
-            new_count=self.config['sources']['hatena']['new_count']
+            popular_count=self.hatena_config['popular_count'],
+            new_count=self.hatena_config['new_count'],
+            cache_dir=self._get_cache_dir()
         )
         return fetcher.fetch_all()
 
     def _fetch_hackernews(self) -> List[Dict[str, Any]]:
         """Fetch articles from Hacker News"""
+        from fetchers.hackernews_fetcher import HackerNewsFetcher
+
         fetcher = HackerNewsFetcher(
-            story_count=self.config['sources']['hackernews']['story_count']
+            story_count=self.hackernews_config['story_count'],
+            cache_dir=self._get_cache_dir()
         )
         return fetcher.fetch_all()
 
     def _fetch_reddit(self) -> List[Dict[str, Any]]:
         """Fetch articles from Reddit"""
+        from fetchers.reddit_fetcher import RedditFetcher
+
         fetcher = RedditFetcher(
-            post_count=self.config['sources']['reddit']['post_count'],
-            use_personal_feed=self.config['sources']['reddit']['use_personal_feed']
+            post_count=self.reddit_config['post_count'],
+            use_personal_feed=self.reddit_config['use_personal_feed']
         )
         return fetcher.fetch_all()
 
+    def _get_cache_dir(self) -> Optional[str]:
+        """Get the on-disk cache directory, or None if caching is disabled"""
+        if not self.cache_config.get('enabled', False):
+            return None
+        return self.cache_config.get('dir', '.cache')
+
     def _retry_operation(self, operation, operation_name: str) -> List[Dict[str, Any]]:
         """
-        Retry an operation with exponential backoff
+        Retry an operation with jittered exponential backoff
 
         Args:
             operation: Function to execute
@@ -130,18 +159,23 @@ class DigestGenerator:
         """
         for attempt in range(1, self.max_retries + 1):
             try:
-                logger.info(f"Attempting {operation_name} (attempt {attempt}/{self.max_retries})")
+                logger.info(
+                    "Attempting %s (attempt %s/%s)", operation_name, attempt, self.max_retries
+                )
                 result = operation()
-                logger.info(f"{operation_name} succeeded")
+                logger.info("%s succeeded", operation_name)
                 return result
             except Exception as e:
-                logger.error(f"{operation_name} failed (attempt {attempt}/{self.max_retries}): {e}")
+                logger.error(
+                    "%s failed (attempt %s/%s): %s", operation_name, attempt, self.max_retries, e
+                )
                 if attempt < self.max_retries:
-                    delay = self.retry_delay * (2 ** (attempt - 1))  # Exponential backoff
-                    logger.info(f"Retrying in {delay} seconds...")
+                    # Exponential backoff with full jitter so concurrent retries spread out
+                    delay = random.uniform(0, self.retry_delay * (2 ** (attempt - 1)))
+                    logger.info("Retrying in %.1f seconds...", delay)
                     time.sleep(delay)
                 else:
-                    logger.error(f"{operation_name} failed after {self.max_retries} attempts")
+                    logger.error("%s failed after %s attempts", operation_name, self.max_retries)
 
         return []
 
@@ -155,11 +189,20 @@ class DigestGenerator:
         Returns:
             Summary data
         """
+        from summarizer import AISummarizer
+
         def _summarize():
             summarizer = AISummarizer(
-                model=self.config['ai']['model'],
-                max_tokens=self.config['ai']['max_tokens'],
-                temperature=self.config['ai']['temperature']
+                model=self.ai_config['model'],
+                max_tokens=self.ai_config['max_tokens'],
+                temperature=self.ai_config['temperature'],
+                use_batch_api=self.ai_config.get('use_batch_api', False),
+                batch_poll_interval=self.ai_config.get('batch_poll_interval', 60),
+                batch_timeout=self.ai_config.get('batch_timeout', 3600),
+                request_timeout=self.ai_config.get('request_timeout', 120),
+                max_retries=self.ai_config.get('max_retries', 2),
+                prompt_cache_ttl=self.ai_config.get('prompt_cache_ttl', '5m'),
+                cache_dir=self._get_cache_dir()
             )
             return summarizer.summarize_articles(articles)
 
@@ -190,6 +233,8 @@ class DigestGenerator:
         Returns:
             Generated HTML content
         """
+        from html_generator import HTMLGenerator
+
         logger.info("Generating HTML digest...")
         generator = HTMLGenerator()
         generator.generate_digest_page(summary_data, date, output_path)
@@ -206,10 +251,12 @@ class DigestGenerator:
             html_content: HTML content to archive
             date: Date of digest
         """
+        from archive_manager import ArchiveManager
+
         logger.info("Updating archives...")
         manager = ArchiveManager(
-            archive_dir=self.config.get('archive', {}).get('dir', 'archive'),
-            keep_days=self.config['archive']['keep_days']
+            archive_dir=self.archive_config.get('dir', 'archive'),
+            keep_days=self.archive_config['keep_days']
         )
 
         # Save to archive
@@ -219,7 +266,7 @@ class DigestGenerator:
         manager.cleanup_old_archives()
 
         # Generate archive index
-        if self.config['archive']['generate_index']:
+        if self.archive_config['generate_index']:
             manager.generate_archive_index()
 
     def generate(self) -> bool:
@@ -246,7 +293,7 @@ class DigestGenerator:
                 return False
 
             # Step 2: Summarize with AI
-            logger.info(f"\n[2/4] Summarizing {len(articles)} articles with AI...")
+            logger.info("\n[2/4] Summarizing %s articles with AI...", len(articles))
             summary_data = self.summarize_with_ai(articles)
 
             # Step 3: Generate HTML
@@ -260,16 +307,16 @@ class DigestGenerator:
             # Success
             elapsed = time.time() - start_time
             logger.info("\n" + "=" * 60)
-            logger.info(f"✅ Digest generation completed successfully!")
-            logger.info(f"⏱️  Time elapsed: {elapsed:.2f} seconds")
-            logger.info(f"📊 Articles processed: {len(articles)}")
-            logger.info(f"📝 Output: index.html")
+            logger.info("✅ Digest generation completed successfully!")
+            logger.info("⏱️  Time elapsed: %.2f seconds", elapsed)
+            logger.info("📊 Articles processed: %s", len(articles))
+            logger.info("📝 Output: index.html")
             logger.info("=" * 60)
 
             return True
 
         except Exception as e:
-            logger.error(f"Fatal error during digest generation: {e}", exc_info=True)
+            logger.error("Fatal error during digest generation: %s", e, exc_info=True)
             return False
 
 
@@ -281,7 +328,7 @@ def main():
         missing_vars = [var for var in required_vars if not os.getenv(var)]
 
         if missing_vars:
-            logger.error(f"Missing required environment variables: {', '.join(missing_vars)}")
+            logger.error("Missing required environment variables: %s", ', '.join(missing_vars))
             logger.error("Please set them before running the script.")
             sys.exit(1)
 
@@ -290,7 +337,7 @@ def main():
         missing_reddit = [var for var in reddit_vars if not os.getenv(var)]
 
         if missing_reddit:
-            logger.warning(f"Missing Reddit credentials: {', '.join(missing_reddit)}")
+            logger.warning("Missing Reddit credentials: %s", ', '.join(missing_reddit))
             logger.warning("Reddit fetching will be skipped unless credentials are provided.")
 
         # Generate digest
@@ -304,7 +351,7 @@ def main():
         logger.info("\nGeneration interrupted by user")
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         sys.exit(1)
 
 
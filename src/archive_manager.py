@@ -4,17 +4,22 @@ Manages digest archives and generates archive index page
 """
 
 import os
+import re
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict
-import glob
+from typing import ClassVar, List, Dict
 
 logger = logging.getLogger(__name__)
 
+# Archive filenames look like YYYY-MM-DD.html; groups are year, month, day
+_ARCHIVE_NAME_RE = re.compile(r'^(20\d{2})-(\d{2})-(\d{2})\.html$')
+
 
 class ArchiveManager:
     """Manages archive of past digests"""
 
+    WEEKDAY_JA = ('月', '火', '水', '木', '金', '土', '日')
+
     def __init__(self, archive_dir: str = "archive", keep_days: int = 90):
         """
         Initialize archive manager
@@ -43,41 +48,69 @@ class ArchiveManager:
         filename = f"{date.strftime('%Y-%m-%d')}.html"
         filepath = os.path.join(self.archive_dir, filename)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        self._write_atomic(filepath, html_content)
 
-        logger.info(f"Saved digest to archive: {filepath}")
+        logger.info("Saved digest to archive: %s", filepath)
         return filepath
 
+    def _write_atomic(self, filepath: str, content: str) -> None:
+        """
+        Write a file via a temporary file and rename it into place
+
+        Readers see either the old or the new file, never a partial write.
+
+        Args:
+            filepath: Destination path
+            content: Text content to write
+        """
+        tmp_path = f"{filepath}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            # Don't leave a half-written file behind
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
     def cleanup_old_archives(self) -> None:
         """Remove archives older than keep_days"""
         cutoff_date = datetime.now() - timedelta(days=self.keep_days)
-        logger.info(f"Cleaning up archives older than {cutoff_date.strftime('%Y-%m-%d')}")
+        logger.info("Cleaning up archives older than %s", cutoff_date.strftime('%Y-%m-%d'))
 
-        pattern = os.path.join(self.archive_dir, "*.html")
         removed_count = 0
 
-        for filepath in glob.glob(pattern):
-            filename = os.path.basename(filepath)
+        # Collect entries first so files are not removed mid-iteration
+        with os.scandir(self.archive_dir) as entries:
+            archive_entries = [entry for entry in entries if entry.name.endswith('.html')]
+
+        for entry in archive_entries:
+            filepath = entry.path
 
             # Skip if not a date-formatted file
-            if not filename.startswith('20'):  # Simple check for year 20XX
+            match = _ARCHIVE_NAME_RE.match(entry.name)
+            if not match:
                 continue
 
             try:
                 # Extract date from filename (YYYY-MM-DD.html)
-                date_str = filename.replace('.html', '')
-                file_date = datetime.strptime(date_str, '%Y-%m-%d')
+                year, month, day = map(int, match.groups())
+                file_date = datetime(year, month, day)
 
                 if file_date < cutoff_date:
                     os.remove(filepath)
                     removed_count += 1
-                    logger.info(f"Removed old archive: {filepath}")
+                    logger.info("Removed old archive: %s", filepath)
 
             except (ValueError, OSError) as e:
-                logger.warning(f"Error processing archive file {filepath}: {e}")
+                logger.warning("Error processing archive file %s: %s", filepath, e)
 
-        logger.info(f"Cleanup complete. Removed {removed_count} old archives")
+        logger.info("Cleanup complete. Removed %s old archives", removed_count)
 
     def get_archive_list(self) -> List[Dict[str, str]]:
         """
@@ -86,35 +119,38 @@ class ArchiveManager:
         Returns:
             List of dictionaries with archive information
         """
-        pattern = os.path.join(self.archive_dir, "*.html")
         archives = []
 
-        for filepath in glob.glob(pattern):
-            filename = os.path.basename(filepath)
-
-            # Skip if not a date-formatted file
-            if not filename.startswith('20'):
-                continue
-
-            try:
-                # Extract date from filename
-                date_str = filename.replace('.html', '')
-                file_date = datetime.strptime(date_str, '%Y-%m-%d')
-
-                # Get file size
-                file_size = os.path.getsize(filepath)
-                size_kb = file_size / 1024
-
-                archives.append({
-                    'date': file_date,
-                    'date_str': date_str,
-                    'filename': filename,
-                    'filepath': filepath,
-                    'size_kb': round(size_kb, 1)
-                })
-
-            except (ValueError, OSError) as e:
-                logger.warning(f"Error processing archive file {filepath}: {e}")
+        with os.scandir(self.archive_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+                filepath = entry.path
+
+                # Skip if not a date-formatted file
+                match = _ARCHIVE_NAME_RE.match(filename)
+                if not match:
+                    continue
+
+                try:
+                    # Extract date from filename (YYYY-MM-DD.html)
+                    year, month, day = map(int, match.groups())
+                    file_date = datetime(year, month, day)
+                    date_str = filename[:10]
+
+                    # Get file size from the directory entry
+                    file_size = entry.stat().st_size
+                    size_kb = file_size / 1024
+
+                    archives.append({
+                        'date': file_date,
+                        'date_str': date_str,
+                        'filename': filename,
+                        'filepath': filepath,
+                        'size_kb': round(size_kb, 1)
+                    })
+
+                except (ValueError, OSError) as e:
+                    logger.warning("Error processing archive file %s: %s", filepath, e)
 
         # Sort by date, most recent first
         archives.sort(key=lambda x: x['date'], reverse=True)
@@ -135,10 +171,9 @@ class ArchiveManager:
         html = self._build_archive_html(archives)
 
         # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        self._write_atomic(output_path, html)
 
-        logger.info(f"Archive index saved to {output_path}")
+        logger.info("Archive index saved to %s", output_path)
 
     def _build_archive_html(self, archives: List[Dict[str, str]]) -> str:
         """
@@ -158,39 +193,42 @@ class ArchiveManager:
                 archives_by_month[month_key] = []
             archives_by_month[month_key].append(archive)
 
-        # Generate archive items HTML
-        archive_sections = []
+        # Generate archive sections HTML into a single buffer
+        out = []
+        append = out.append
+        weekday_ja = self.WEEKDAY_JA
+        archive_dir = self.archive_dir
         for month, month_archives in archives_by_month.items():
-            items = []
+            # All archives in a group share the same month label
+            month_label = month_archives[0]['date'].strftime('%m月')
+
+            append(f"""
+        <section class="month-section">
+            <h2>📅 {month}</h2>
+            <div class="archive-grid">
+                """)
+
             for archive in month_archives:
                 date = archive['date']
-                weekday_ja = ['月', '火', '水', '木', '金', '土', '日']
                 weekday = weekday_ja[date.weekday()]
-                date_display = f"{date.strftime('%m月%d日')}（{weekday}）"
 
-                item = f"""
+                append(f"""
                     <div class="archive-item">
-                        <a href="{self.archive_dir}/{archive['filename']}">
+                        <a href="{archive_dir}/{archive['filename']}">
                             <div class="archive-date">
                                 <span class="day">{date.day}</span>
-                                <span class="month">{date.strftime('%m月')}</span>
+                                <span class="month">{month_label}</span>
                             </div>
                             <div class="archive-info">
                                 <h3>{archive['date_str']} ({weekday})</h3>
                                 <p class="archive-meta">{archive['size_kb']} KB</p>
                             </div>
                         </a>
-                    </div>"""
-                items.append(item)
+                    </div>""")
 
-            section = f"""
-        <section class="month-section">
-            <h2>📅 {month}</h2>
-            <div class="archive-grid">
-                {''.join(items)}
+            append("""
             </div>
-        </section>"""
-            archive_sections.append(section)
+        </section>""")
 
         html = f"""<!DOCTYPE html>
 <html lang="ja">
@@ -198,7 +236,7 @@ class ArchiveManager:
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>アーカイブ - デイリーダイジェスト</title>
-    {self._get_archive_css()}
+    {self._ARCHIVE_CSS}
 </head>
 <body>
     <header class="colorful-header">
@@ -219,7 +257,7 @@ class ArchiveManager:
             </div>
         </div>
 
-        {''.join(archive_sections)}
+        {''.join(out)}
     </main>
 
     <footer>
@@ -227,15 +265,14 @@ class ArchiveManager:
         <p class="disclaimer">アーカイブは{self.keep_days}日間保存されます。</p>
     </footer>
 
-    {self._get_archive_javascript()}
+    {self._ARCHIVE_JS}
 </body>
 </html>"""
 
         return html
 
-    def _get_archive_css(self) -> str:
-        """Get CSS for archive page"""
-        return """    <style>
+    # Static CSS for archive page
+    _ARCHIVE_CSS: ClassVar[str] = """    <style>
         :root {
             --bg-primary: #ffffff;
             --bg-secondary: #f8f9fa;
@@ -457,9 +494,8 @@ class ArchiveManager:
         }
     </style>"""
 
-    def _get_archive_javascript(self) -> str:
-        """Get JavaScript for archive page"""
-        return """    <script>
+    # Static JavaScript for archive page
+    _ARCHIVE_JS: ClassVar[str] = """    <script>
         // Dark mode support (sync with main page)
         if (localStorage.getItem('darkMode') === 'enabled') {
             document.body.classList.add('dark-mode');
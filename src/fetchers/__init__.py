@@ -1,9 +1,23 @@
 """
 Data fetchers for various news sources
+
+Each fetcher is imported on first access, so using one source does not
+require the dependencies of the others.
 """
 
-from .hatena_fetcher import HatenaFetcher
-from .hackernews_fetcher import HackerNewsFetcher
-from .reddit_fetcher import RedditFetcher
+import importlib
+
+_FETCHER_MODULES = {
+    'HatenaFetcher': '.hatena_fetcher',
+    'HackerNewsFetcher': '.hackernews_fetcher',
+    'RedditFetcher': '.reddit_fetcher',
+}
 
 __all__ = ['HatenaFetcher', 'HackerNewsFetcher', 'RedditFetcher']
+
+
+def __getattr__(name):
+    if name in _FETCHER_MODULES:
+        module = importlib.import_module(_FETCHER_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
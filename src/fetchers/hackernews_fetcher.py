@@ -3,11 +3,16 @@ Hacker News fetcher
 Fetches top and best stories from Hacker News API
 """
 
-import requests
-from typing import List, Dict
-import logging
+import asyncio
+import aiohttp
+import heapq
+import json
+import orjson
+import os
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from typing import List, Dict, Optional
+import logging
 
 logger = logging.getLogger(__name__)
 
@@ -20,15 +25,37 @@ class HackerNewsFetcher:
     BEST_STORIES_URL = f"{BASE_URL}/beststories.json"
     ITEM_URL = f"{BASE_URL}/item/{{item_id}}.json"
 
-    def __init__(self, story_count: int = 30):
+    # Connections opened while the top-stories list is still downloading
+    WARMUP_CONNECTIONS = 4
+
+    # Cached items older than this are deleted; stories rarely stay on the
+    # top list for more than a day or two
+    CACHE_MAX_AGE = 2 * 24 * 3600
+
+    def __init__(
+        self,
+        story_count: int = 30,
+        cache_dir: Optional[str] = None,
+        cache_ttl: int = 3600
+    ):
         """
         Initialize Hacker News fetcher
 
         Args:
             story_count: Number of stories to fetch
+            cache_dir: Directory for cached item responses (None disables caching)
+            cache_ttl: Seconds a cached item is reused without asking the API. The
+                default only covers re-runs on the same day (workflow re-runs
+                and manual runs, which restore .cache from the Actions cache);
+                a daily run asks the API again so scores stay current
         """
         self.story_count = story_count
-        self.session = requests.Session()
+        self.cache_dir = os.path.join(cache_dir, 'hn') if cache_dir else None
+        self.cache_ttl = cache_ttl
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._prune_cache()
 
     def fetch_stories(self) -> List[Dict[str, any]]:
         """
@@ -37,95 +64,233 @@ class HackerNewsFetcher:
         Returns:
             List of story dictionaries
         """
-        logger.info(f"Fetching {self.story_count} stories from Hacker News...")
+        logger.info("Fetching %s stories from Hacker News...", self.story_count)
         try:
-            # Get top story IDs
-            response = self.session.get(self.TOP_STORIES_URL, timeout=10)
-            response.raise_for_status()
-            story_ids = response.json()[:self.story_count]
+            # Rank by score (points), keeping at most story_count stories
+            stories = heapq.nlargest(
+                self.story_count,
+                asyncio.run(self._fetch_stories_async()),
+                key=itemgetter('score')
+            )
 
-            # Fetch story details in parallel
-            stories = self._fetch_story_details(story_ids)
-
-            logger.info(f"Successfully fetched {len(stories)} HN stories")
+            logger.info("Successfully fetched %s HN stories", len(stories))
             return stories
 
         except Exception as e:
-            logger.error(f"Error fetching Hacker News stories: {e}")
+            logger.error("Error fetching Hacker News stories: %s", e)
             return []
 
-    def _fetch_story_details(self, story_ids: List[int]) -> List[Dict[str, any]]:
+    async def _fetch_stories_async(self) -> List[Dict[str, any]]:
         """
-        Fetch details for multiple stories in parallel
+        Fetch top story IDs and their details over one keep-alive session
+
+        Returns:
+            List of story dictionaries
+        """
+        connector = aiohttp.TCPConnector(limit=50, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # Warm extra connections for the item fetches in the background, so
+            # a slow warm-up never holds up the fetches themselves
+            warm_up = asyncio.create_task(self._warm_up_connections(session))
+            try:
+                story_ids = await self._fetch_top_story_ids(session)
+
+                # Fetch story details concurrently, reusing the same connections
+                return await self._fetch_story_details(session, story_ids)
+            finally:
+                warm_up.cancel()
+
+    async def _fetch_top_story_ids(self, session: aiohttp.ClientSession) -> List[int]:
+        """
+        Fetch the current top story IDs
 
         Args:
-            story_ids: List of story IDs to fetch
+            session: Shared aiohttp session
 
         Returns:
-            List of story dictionaries
+            List of story IDs, limited to story_count
         """
-        stories = []
+        async with session.get(
+            self.TOP_STORIES_URL,
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            response.raise_for_status()
+            return orjson.loads(await response.read())[:self.story_count]
 
-        # Use ThreadPoolExecutor for parallel fetching
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_id = {
-                executor.submit(self._fetch_single_story, story_id): story_id
-                for story_id in story_ids
-            }
+    async def _warm_up_connections(self, session: aiohttp.ClientSession) -> None:
+        """
+        Open pooled connections to the API host ahead of the item fetches
+
+        Failures are ignored; the item fetches simply open their own connections.
 
-            for future in as_completed(future_to_id):
-                try:
-                    story = future.result()
-                    if story:
-                        stories.append(story)
-                except Exception as e:
-                    logger.warning(f"Error fetching story: {e}")
+        Args:
+            session: Shared aiohttp session
+        """
+        async def _head() -> None:
+            try:
+                async with session.head(self.BASE_URL, timeout=aiohttp.ClientTimeout(total=5)):
+                    pass
+            except Exception as e:
+                logger.debug("HN connection warm-up failed: %s", e)
 
-        # Sort by score (points) to maintain ranking
-        stories.sort(key=lambda x: x.get('score', 0), reverse=True)
+        await asyncio.gather(*[_head() for _ in range(self.WARMUP_CONNECTIONS)])
+
+    async def _fetch_story_details(
+        self,
+        session: aiohttp.ClientSession,
+        story_ids: List[int]
+    ) -> List[Dict[str, any]]:
+        """
+        Fetch details for multiple stories concurrently
+
+        Args:
+            session: Shared aiohttp session
+            story_ids: List of story IDs to fetch
+
+        Returns:
+            List of story dictionaries (failed or non-story items are dropped)
+        """
+        results = await asyncio.gather(
+            *[self._fetch_single_story_async(session, story_id) for story_id in story_ids],
+            return_exceptions=True
+        )
+
+        stories = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("Error fetching story: %s", result)
+            elif result:
+                stories.append(result)
         return stories
 
-    def _fetch_single_story(self, story_id: int) -> Dict[str, any]:
+    async def _fetch_single_story_async(
+        self,
+        session: aiohttp.ClientSession,
+        story_id: int
+    ) -> Dict[str, any]:
         """
         Fetch a single story's details
 
         Args:
+            session: Shared aiohttp session
             story_id: Story ID to fetch
 
         Returns:
             Story dictionary or None if fetch fails
         """
         try:
+            # Title/URL never change and score drifts slowly, so a recent copy is good enough
+            cached = self._load_cached_story(story_id)
+            if cached and time.time() - cached['fetched_at'] < self.cache_ttl:
+                return cached['story']
+
+            headers = {}
+            if cached and cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+
             url = self.ITEM_URL.format(item_id=story_id)
-            response = self.session.get(url, timeout=5)
-            response.raise_for_status()
-            data = response.json()
+            async with session.get(
+                url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                if response.status == 304:
+                    self._save_cached_story(story_id, cached['story'], cached['etag'])
+                    return cached['story']
+                response.raise_for_status()
+                data = orjson.loads(await response.read())
+                etag = response.headers.get('ETag')
 
             # Only include stories with URLs (not Ask HN, etc.)
             if not data or data.get('type') != 'story':
                 return None
 
             # Get the URL - use story URL if available, otherwise HN discussion
-            story_url = data.get('url')
-            if not story_url:
-                story_url = f"https://news.ycombinator.com/item?id={story_id}"
+            hn_url = f"https://news.ycombinator.com/item?id={story_id}"
+            story_url = data.get('url') or hn_url
 
-            return {
+            story = {
                 'source': 'Hacker News',
                 'title': data.get('title', ''),
                 'url': story_url,
                 'score': data.get('score', 0),
                 'comments_count': data.get('descendants', 0),
                 'score_label': f"{data.get('score', 0)} points",
-                'hn_url': f"https://news.ycombinator.com/item?id={story_id}",
+                'hn_url': hn_url,
                 'author': data.get('by', ''),
                 'time': data.get('time', 0)
             }
+            self._save_cached_story(story_id, story, etag)
+            return story
 
         except Exception as e:
-            logger.warning(f"Error fetching story {story_id}: {e}")
+            logger.warning("Error fetching story %s: %s", story_id, e)
             return None
 
+    def _load_cached_story(self, story_id: int) -> Optional[Dict[str, any]]:
+        """
+        Load a cached story entry
+
+        Args:
+            story_id: Story ID to look up
+
+        Returns:
+            Dictionary with fetched_at, etag and story, or None if not cached
+        """
+        if not self.cache_dir:
+            return None
+
+        path = os.path.join(self.cache_dir, f"{story_id}.json")
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_cached_story(
+        self,
+        story_id: int,
+        story: Dict[str, any],
+        etag: Optional[str]
+    ) -> None:
+        """
+        Save a story to the item cache
+
+        Args:
+            story_id: Story ID
+            story: Parsed story dictionary
+            etag: ETag returned by the API, if any
+        """
+        if not self.cache_dir:
+            return
+
+        path = os.path.join(self.cache_dir, f"{story_id}.json")
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(
+                    {'fetched_at': time.time(), 'etag': etag, 'story': story},
+                    f,
+                    ensure_ascii=False
+                )
+        except OSError as e:
+            logger.warning("Error caching story %s: %s", story_id, e)
+
+    def _prune_cache(self) -> None:
+        """
+        Delete cached items older than CACHE_MAX_AGE
+
+        Every story gets its own cache file, so without pruning the directory
+        grows with every run.
+        """
+        cutoff = time.time() - self.CACHE_MAX_AGE
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+        except OSError as e:
+            logger.warning("Error pruning HN cache: %s", e)
+
     def fetch_all(self) -> List[Dict[str, any]]:
         """
         Fetch all stories
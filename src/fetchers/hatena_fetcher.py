@@ -4,10 +4,15 @@ Fetches popular and new entries from Hatena Bookmark using RSS feeds
 """
 
 import requests
-import xml.etree.ElementTree as ET
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional
+import io
+import json
 import logging
-import time
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -25,21 +30,54 @@ class HatenaFetcher:
         'hatena': 'http://www.hatena.ne.jp/info/xmlns#'
     }
 
-    def __init__(self, popular_count: int = 25, new_count: int = 15):
+    # Clark-notation tags, expanded once so lookups skip prefix resolution
+    ITEM_TAG = f"{{{NAMESPACES['rss']}}}item"
+    _T_TITLE = f"{{{NAMESPACES['rss']}}}title"
+    _T_LINK = f"{{{NAMESPACES['rss']}}}link"
+    _T_BOOKMARK = f"{{{NAMESPACES['hatena']}}}bookmarkcount"
+    _T_SUBJECT = f"{{{NAMESPACES['dc']}}}subject"
+    _T_DESC = f"{{{NAMESPACES['rss']}}}description"
+
+    def __init__(
+        self,
+        popular_count: int = 25,
+        new_count: int = 15,
+        cache_dir: Optional[str] = None
+    ):
         """
         Initialize Hatena fetcher
 
         Args:
             popular_count: Number of popular entries to fetch
             new_count: Number of new entries to fetch
+            cache_dir: Directory for cached feed validators (None disables caching)
         """
         self.popular_count = popular_count
         self.new_count = new_count
+        self.cache_dir = os.path.join(cache_dir, 'hatena') if cache_dir else None
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
 
+        # Both feeds live on the same host; keep their connections alive and
+        # retry transient gateway errors before giving up
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(['GET'])
+            )
+        )
+        self.session.mount('https://', adapter)
+
     def fetch_popular(self) -> List[Dict[str, any]]:
         """
         Fetch popular entries from Hatena Bookmark RSS
@@ -47,13 +85,11 @@ class HatenaFetcher:
         Returns:
             List of article dictionaries with title, url, bookmarks, etc.
         """
-        logger.info(f"Fetching {self.popular_count} popular entries from Hatena RSS...")
+        logger.info("Fetching %s popular entries from Hatena RSS...", self.popular_count)
         try:
-            response = self.session.get(self.POPULAR_RSS_URL, timeout=10)
-            response.raise_for_status()
-            return self._parse_rss(response.content, limit=self.popular_count)
+            return self._fetch_feed(self.POPULAR_RSS_URL, limit=self.popular_count)
         except Exception as e:
-            logger.error(f"Error fetching Hatena popular RSS: {e}")
+            logger.error("Error fetching Hatena popular RSS: %s", e)
             return []
 
     def fetch_new(self) -> List[Dict[str, any]]:
@@ -63,15 +99,109 @@ class HatenaFetcher:
         Returns:
             List of article dictionaries with title, url, bookmarks, etc.
         """
-        logger.info(f"Fetching {self.new_count} new entries from Hatena RSS...")
+        logger.info("Fetching %s new entries from Hatena RSS...", self.new_count)
         try:
-            response = self.session.get(self.NEW_RSS_URL, timeout=10)
-            response.raise_for_status()
-            return self._parse_rss(response.content, limit=self.new_count)
+            return self._fetch_feed(self.NEW_RSS_URL, limit=self.new_count)
         except Exception as e:
-            logger.error(f"Error fetching Hatena new RSS: {e}")
+            logger.error("Error fetching Hatena new RSS: %s", e)
             return []
 
+    def _fetch_feed(self, url: str, limit: int) -> List[Dict[str, any]]:
+        """
+        Fetch and parse an RSS feed, reusing cached entries when it is unchanged
+
+        Args:
+            url: RSS feed URL
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of parsed article dictionaries
+        """
+        cached = self._load_cached_feed(url)
+        # Entries parsed with a different limit cannot stand in for this request
+        if cached and cached.get('limit') != limit:
+            cached = None
+
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        response = self.session.get(url, headers=headers, timeout=10)
+        if response.status_code == 304 and cached:
+            logger.info("Hatena RSS not modified, reusing %s entries", len(cached['entries']))
+            return cached['entries']
+
+        response.raise_for_status()
+        entries = self._parse_rss(response.content, limit=limit)
+        if entries:
+            self._save_cached_feed(url, limit, response, entries)
+        return entries
+
+    def _load_cached_feed(self, url: str) -> Optional[Dict[str, any]]:
+        """
+        Load the cached validators and entries for a feed
+
+        Args:
+            url: RSS feed URL
+
+        Returns:
+            Dictionary with etag, last_modified, limit and entries, or None if not cached
+        """
+        if not self.cache_dir:
+            return None
+
+        try:
+            with open(self._cache_path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_cached_feed(
+        self,
+        url: str,
+        limit: int,
+        response: requests.Response,
+        entries: List[Dict[str, any]]
+    ) -> None:
+        """
+        Save a feed's validators and parsed entries to the cache
+
+        Args:
+            url: RSS feed URL
+            limit: Limit the entries were parsed with
+            response: Response the entries were parsed from
+            entries: Parsed article dictionaries
+        """
+        if not self.cache_dir:
+            return
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        try:
+            with open(self._cache_path(url), 'w', encoding='utf-8') as f:
+                json.dump(
+                    {
+                        'etag': etag,
+                        'last_modified': last_modified,
+                        'limit': limit,
+                        'entries': entries
+                    },
+                    f,
+                    ensure_ascii=False
+                )
+        except OSError as e:
+            logger.warning("Error caching Hatena feed %s: %s", url, e)
+
+    def _cache_path(self, url: str) -> str:
+        """Get the cache file path for a feed URL"""
+        return os.path.join(self.cache_dir, f"{url.rsplit('/', 1)[-1]}.json")
+
     def _parse_rss(self, xml_content: bytes, limit: int) -> List[Dict[str, any]]:
         """
         Parse RSS XML and extract article information
@@ -84,26 +214,40 @@ class HatenaFetcher:
             List of parsed article dictionaries
         """
         try:
-            root = ET.fromstring(xml_content)
             entries = []
-
-            # Find all items in the RSS feed
-            items = root.findall('.//rss:item', self.NAMESPACES)
-
-            for item in items[:limit]:
+            context = etree.iterparse(
+                io.BytesIO(xml_content),
+                events=('end',),
+                tag=self.ITEM_TAG,
+                recover=True,
+                remove_blank_text=True,
+                remove_comments=True,
+                resolve_entities=False,
+                huge_tree=False
+            )
+
+            # Stream items one at a time and stop as soon as we have enough
+            for count, (_, item) in enumerate(context, 1):
                 try:
                     entry = self._parse_rss_item(item)
                     if entry:
                         entries.append(entry)
                 except Exception as e:
-                    logger.warning(f"Error parsing RSS item: {e}")
-                    continue
+                    logger.warning("Error parsing RSS item: %s", e)
+
+                # Drop the processed item and any preceding siblings
+                item.clear()
+                while item.getprevious() is not None:
+                    del item.getparent()[0]
 
-            logger.info(f"Successfully parsed {len(entries)} Hatena entries from RSS")
+                if count >= limit:
+                    break
+
+            logger.info("Successfully parsed %s Hatena entries from RSS", len(entries))
             return entries
 
         except Exception as e:
-            logger.error(f"Error parsing RSS XML: {e}")
+            logger.error("Error parsing RSS XML: %s", e)
             return []
 
     def _parse_rss_item(self, item) -> Optional[Dict[str, any]]:
@@ -111,46 +255,36 @@ class HatenaFetcher:
         Parse individual RSS item element
 
         Args:
-            item: ElementTree item element
+            item: lxml item element
 
         Returns:
             Dictionary with article data or None if parsing fails
         """
         try:
-            ns = self.NAMESPACES
-
             # Get title (required)
-            title_elem = item.find('rss:title', ns)
-            if title_elem is None or not title_elem.text:
+            title = item.findtext(self._T_TITLE, '')
+            if not title:
                 return None
-            title = title_elem.text
 
             # Get URL (required)
-            link_elem = item.find('rss:link', ns)
-            if link_elem is None or not link_elem.text:
+            url = item.findtext(self._T_LINK, '')
+            if not url:
                 return None
-            url = link_elem.text
 
             # Get bookmark count
             bookmarks = 0
-            bookmark_elem = item.find('hatena:bookmarkcount', ns)
-            if bookmark_elem is not None and bookmark_elem.text:
+            bookmark_text = item.findtext(self._T_BOOKMARK, '')
+            if bookmark_text:
                 try:
-                    bookmarks = int(bookmark_elem.text)
+                    bookmarks = int(bookmark_text)
                 except ValueError:
                     bookmarks = 0
 
             # Get category (first subject tag)
-            category = ''
-            subject_elem = item.find('dc:subject', ns)
-            if subject_elem is not None and subject_elem.text:
-                category = subject_elem.text
+            category = item.findtext(self._T_SUBJECT, '')
 
             # Get description
-            description = ''
-            desc_elem = item.find('rss:description', ns)
-            if desc_elem is not None and desc_elem.text:
-                description = desc_elem.text
+            description = item.findtext(self._T_DESC, '')
 
             return {
                 'source': 'はてブ',
@@ -163,7 +297,7 @@ class HatenaFetcher:
             }
 
         except Exception as e:
-            logger.warning(f"Error parsing RSS item element: {e}")
+            logger.warning("Error parsing RSS item element: %s", e)
             return None
 
     def fetch_all(self) -> List[Dict[str, any]]:
@@ -173,26 +307,17 @@ class HatenaFetcher:
         Returns:
             Combined list of all entries
         """
-        all_entries = []
-
-        # Fetch popular entries
-        popular = self.fetch_popular()
-        all_entries.extend(popular)
-
-        # Small delay between requests
-        time.sleep(1)
-
-        # Fetch new entries
-        new = self.fetch_new()
-        all_entries.extend(new)
-
-        # Remove duplicates based on URL
-        seen_urls = set()
-        unique_entries = []
+        # The two feeds are independent requests, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            popular = executor.submit(self.fetch_popular)
+            new = executor.submit(self.fetch_new)
+            all_entries = popular.result() + new.result()
+
+        # Remove duplicates based on URL, keeping the first occurrence
+        unique_by_url = {}
         for entry in all_entries:
-            if entry['url'] not in seen_urls:
-                seen_urls.add(entry['url'])
-                unique_entries.append(entry)
+            unique_by_url.setdefault(entry['url'], entry)
+        unique_entries = list(unique_by_url.values())
 
-        logger.info(f"Total unique Hatena entries: {len(unique_entries)}")
+        logger.info("Total unique Hatena entries: %s", len(unique_entries))
         return unique_entries
@@ -36,7 +36,7 @@ class RedditFetcher:
             )
             logger.info("Reddit client initialized successfully")
         except Exception as e:
-            logger.error(f"Error initializing Reddit client: {e}")
+            logger.error("Error initializing Reddit client: %s", e)
             self.reddit = None
 
     def fetch_posts(self) -> List[Dict[str, any]]:
@@ -50,29 +50,29 @@ class RedditFetcher:
             logger.error("Reddit client not initialized")
             return []
 
-        logger.info(f"Fetching {self.post_count} posts from Reddit personal feed...")
+        logger.info("Fetching %s posts from Reddit personal feed...", self.post_count)
 
         try:
-            posts = []
-
             if self.use_personal_feed:
                 # Fetch from user's front page (subscribed subreddits)
-                for submission in self.reddit.front.hot(limit=self.post_count):
-                    post = self._parse_submission(submission)
-                    if post:
-                        posts.append(post)
+                listing = self.reddit.front.hot(limit=self.post_count)
             else:
                 # Fetch from r/all as fallback
-                for submission in self.reddit.subreddit('all').hot(limit=self.post_count):
-                    post = self._parse_submission(submission)
-                    if post:
-                        posts.append(post)
+                listing = self.reddit.subreddit('all').hot(limit=self.post_count)
 
-            logger.info(f"Successfully fetched {len(posts)} Reddit posts")
+            # Drain the listing up front so every submission is populated from
+            # the listing JSON before any attributes are read
+            posts = []
+            for submission in list(listing):
+                post = self._parse_submission(submission)
+                if post:
+                    posts.append(post)
+
+            logger.info("Successfully fetched %s Reddit posts", len(posts))
             return posts
 
         except Exception as e:
-            logger.error(f"Error fetching Reddit posts: {e}")
+            logger.error("Error fetching Reddit posts: %s", e)
             return []
 
     def _parse_submission(self, submission) -> Dict[str, any]:
@@ -86,27 +86,32 @@ class RedditFetcher:
             Dictionary with post data
         """
         try:
+            # Read each field once; author and subreddit names come from the
+            # listing data so PRAW never has to fetch those objects lazily
+            permalink = f"https://reddit.com{submission.permalink}"
+            is_self = submission.is_self
+            score = submission.score
+            author = submission.author
+
             # Get the URL - prefer link posts, but include self posts too
-            url = submission.url
-            if submission.is_self:
-                url = f"https://reddit.com{submission.permalink}"
+            url = permalink if is_self else submission.url
 
             return {
                 'source': 'Reddit',
                 'title': submission.title,
                 'url': url,
-                'score': submission.score,
-                'subreddit': submission.subreddit.display_name,
+                'score': score,
+                'subreddit': submission.subreddit_name_prefixed.removeprefix('r/'),
                 'comments_count': submission.num_comments,
-                'score_label': f"{submission.score} upvotes",
-                'reddit_url': f"https://reddit.com{submission.permalink}",
-                'author': str(submission.author) if submission.author else '[deleted]',
-                'is_self': submission.is_self,
-                'selftext': submission.selftext[:200] if submission.is_self else ''
+                'score_label': f"{score} upvotes",
+                'reddit_url': permalink,
+                'author': author.name if author else '[deleted]',
+                'is_self': is_self,
+                'selftext': submission.selftext[:200] if is_self else ''
             }
 
         except Exception as e:
-            logger.warning(f"Error parsing Reddit submission: {e}")
+            logger.warning("Error parsing Reddit submission: %s", e)
             return None
 
     def fetch_all(self) -> List[Dict[str, any]]:
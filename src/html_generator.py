@@ -4,19 +4,39 @@ Creates beautiful, colorful HTML pages with the digest content
 """
 
 import logging
-from typing import Dict, Any, List
+import os
+import re
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Iterator, List
 from datetime import datetime
 import html as html_module
 
 logger = logging.getLogger(__name__)
 
+# Markdown inline link: [text](url). The bounded repeats keep stray unclosed
+# brackets from making each substitution quadratic in the summary length.
+_MD_LINK_RE = re.compile(r'\[([^\]]{1,512})\]\(([^\)]{1,2048})\)')
+
+# Markup for a single per-source summary section, filled in with str.format_map
+_SECTION_TMPL = """
+        <article id="{slug}" class="summary-article source-summary">
+            <h2 class="section-title">{icon} {source} <span class="article-count">({article_count}件)</span></h2>
+            {html_summary}
+        </article>"""
+
+# Shared immutable default for missing list fields, so .get() never allocates
+_EMPTY: tuple = ()
+
 
 class HTMLGenerator:
     """Generates static HTML pages for the digest"""
 
+    WEEKDAY_JA = ('月', '火', '水', '木', '金', '土', '日')
+
     def __init__(self):
         """Initialize HTML generator"""
-        pass
+        # Anchor slugs by source name; the same few sources recur every day
+        self._slug_cache: Dict[str, str] = {}
 
     def generate_digest_page(
         self,
@@ -32,38 +52,54 @@ class HTMLGenerator:
             date: Date of the digest
             output_path: Path to save the HTML file
         """
-        logger.info(f"Generating HTML digest for {date.strftime('%Y-%m-%d')}...")
-
-        # Build HTML content
-        html_content = self._build_html(summary_data, date)
-
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-
-        logger.info(f"HTML digest saved to {output_path}")
-
-    def _build_html(self, summary_data: Dict[str, Any], date: datetime) -> str:
+        iso_date = date.strftime('%Y-%m-%d')
+        logger.info("Generating HTML digest for %s...", iso_date)
+
+        # Stream the encoded HTML fragments into a temporary file and rename it
+        # into place, so readers never see a partially written page
+        tmp_path = f"{output_path}.tmp"
+        try:
+            with open(tmp_path, 'wb', buffering=1 << 16) as f:
+                f.writelines(self._iter_html(summary_data, date, iso_date))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            # Don't leave a half-written page behind
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        logger.info("HTML digest saved to %s", output_path)
+
+    def _iter_html(
+        self,
+        summary_data: Dict[str, Any],
+        date: datetime,
+        iso_date: str
+    ) -> Iterator[bytes]:
         """
-        Build complete HTML document
+        Build complete HTML document as UTF-8 encoded fragments
 
         Args:
             summary_data: Summary data
             date: Digest date
+            iso_date: Digest date formatted as YYYY-MM-DD
 
-        Returns:
-            Complete HTML string
+        Yields:
+            Consecutive UTF-8 encoded pieces of the HTML document
         """
         title = summary_data.get('title', '今日のテックニュースダイジェスト')
         overall_summary = summary_data.get('overall_summary', '')
-        source_summaries = summary_data.get('source_summaries', [])
-        key_topics = summary_data.get('key_topics', [])
+        source_summaries = summary_data.get('source_summaries', _EMPTY)
+        key_topics = summary_data.get('key_topics', _EMPTY)
         total_articles = summary_data.get('total_articles', 0)
 
         # Format date in Japanese
-        weekday_ja = ['月', '火', '水', '木', '金', '土', '日']
         date_str = date.strftime('%Y年%m月%d日')
-        weekday = weekday_ja[date.weekday()]
+        weekday = self.WEEKDAY_JA[date.weekday()]
         formatted_date = f"{date_str}（{weekday}）"
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M PST')
 
@@ -77,20 +113,15 @@ class HTMLGenerator:
         # Generate key topics badges
         topics_html = self._generate_topics_badges(key_topics)
 
-        # Generate source sections
-        source_sections_html = self._generate_source_sections(source_summaries)
-
         # Get list of sources
         sources_list = [s.get('source', '') for s in source_summaries]
         sources_html = ', '.join(sources_list) if sources_list else 'Various sources'
 
-        html = f"""<!DOCTYPE html>
-<html lang="ja">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - {date.strftime('%Y-%m-%d')}</title>
-    {self._get_css()}
+        yield _HEAD_OPEN_BYTES
+        yield f"""{title} - {iso_date}</title>
+    """.encode('utf-8')
+        yield _CSS_BYTES
+        yield f"""
 </head>
 <body>
     <header class="colorful-header">
@@ -116,51 +147,54 @@ class HTMLGenerator:
             {html_overall_summary}
         </article>
 
-        {source_sections_html}
+        """.encode('utf-8')
+
+        # Generate source sections
+        yield from self._generate_source_sections(source_summaries)
+
+        yield f"""
     </main>
 
     <footer>
         <p>📊 分析記事数: {total_articles}件</p>
         <p>ソース: {sources_html}</p>
-        <p>AI要約: Claude Haiku 4.5 (Anthropic) | <a href="archive.html">📚 アーカイブを見る</a></p>
-        <p class="disclaimer">このダイジェストはAIによって自動生成されています。</p>
-    </footer>
-
-    {self._get_javascript()}
-</body>
-</html>"""
-
-        return html
-
-    def _markdown_to_html(self, markdown_text: str) -> str:
+""".encode('utf-8')
+        yield _FOOTER_CLOSE_BYTES
+        yield _JS_BYTES
+        yield _DOCUMENT_CLOSE_BYTES
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _markdown_to_html(markdown_text: str) -> str:
         """
         Convert simple markdown to HTML (links and paragraphs)
 
+        Results are memoized so re-rendering an identical summary is free.
+
         Args:
             markdown_text: Markdown text
 
         Returns:
             HTML string
         """
-        import re
-
         # Escape HTML first
         html_text = html_module.escape(markdown_text)
 
-        # Convert markdown links [text](url) to HTML
-        # We need to unescape the converted links
-        html_text = re.sub(
-            r'\[([^\]]+)\]\(([^\)]+)\)',
-            r'<a href="\2" target="_blank" rel="noopener noreferrer">\1</a>',
-            html_text
+        # Convert markdown links [text](url) to HTML, skipping the regex
+        # entirely for prose without any link syntax
+        if '](' in html_text:
+            html_text = _MD_LINK_RE.sub(
+                r'<a href="\2" target="_blank" rel="noopener noreferrer">\1</a>',
+                html_text
+            )
+
+        # Convert double newlines to paragraphs, stripping each one only once
+        return '\n'.join(
+            f'<p>{paragraph}</p>'
+            for paragraph in (p.strip() for p in html_text.split('\n\n'))
+            if paragraph
         )
 
-        # Convert double newlines to paragraphs
-        paragraphs = html_text.split('\n\n')
-        paragraphs = [f'<p>{p.strip()}</p>' for p in paragraphs if p.strip()]
-
-        return '\n'.join(paragraphs)
-
     def _generate_topics_badges(self, topics: List[Dict[str, Any]]) -> str:
         """
         Generate HTML for topic badges
@@ -196,129 +230,61 @@ class HTMLGenerator:
         for source_summary in source_summaries:
             source = source_summary.get('source', '')
             icon = source_summary.get('icon', '📰')
-            # Create slug for anchor
-            slug = source.lower().replace(' ', '-')
-            nav_items.append(f'<a href="#{slug}">{icon} {source}</a>')
+            nav_items.append(f'<a href="#{self._slug(source)}">{icon} {source}</a>')
 
         return '\n        '.join(nav_items)
 
-    def _generate_source_sections(self, source_summaries: List[Dict[str, Any]]) -> str:
+    def _slug(self, source: str) -> str:
         """
-        Generate HTML sections for each source
+        Get the anchor slug for a source name
 
         Args:
-            source_summaries: List of source summary dictionaries
+            source: Source name
 
         Returns:
-            HTML string for source sections
+            Lowercased source name with spaces replaced by hyphens
         """
-        sections = []
+        slug = self._slug_cache.get(source)
+        if slug is None:
+            slug = source.lower().replace(' ', '-')
+            self._slug_cache[source] = slug
+        return slug
 
-        for source_summary in source_summaries:
+    def _generate_source_sections(
+        self,
+        source_summaries: List[Dict[str, Any]]
+    ) -> Iterator[bytes]:
+        """
+        Generate HTML sections for each source
+
+        Args:
+            source_summaries: List of source summary dictionaries
+
+        Yields:
+            UTF-8 encoded HTML for each source section
+        """
+        for i, source_summary in enumerate(source_summaries):
             source = source_summary.get('source', '')
             icon = source_summary.get('icon', '📰')
             summary = source_summary.get('summary', '')
             article_count = source_summary.get('article_count', 0)
-            slug = source.lower().replace(' ', '-')
+            slug = self._slug(source)
 
             # Convert markdown to HTML
             html_summary = self._markdown_to_html(summary)
 
-            section = f"""
-        <article id="{slug}" class="summary-article source-summary">
-            <h2 class="section-title">{icon} {source} <span class="article-count">({article_count}件)</span></h2>
-            {html_summary}
-        </article>"""
-
-            sections.append(section)
-
-        return '\n'.join(sections)
-
-    def _generate_category_nav(self, categories: List[Dict[str, Any]]) -> str:
-        """Generate navigation links for categories"""
-        nav_items = []
-        for i, category in enumerate(categories):
-            name = category.get('name', f'カテゴリ{i+1}')
-            icon = category.get('icon', '📋')
-            # Create slug for anchor
-            slug = f"category-{i}"
-            nav_items.append(f'<a href="#{slug}">{icon} {name}</a>')
-
-        return '\n        '.join(nav_items)
-
-    def _generate_category_sections(self, categories: List[Dict[str, Any]]) -> str:
-        """Generate HTML for all category sections"""
-        sections = []
-
-        for i, category in enumerate(categories):
-            name = category.get('name', f'カテゴリ{i+1}')
-            icon = category.get('icon', '📋')
-            articles = category.get('articles', [])
-            slug = f"category-{i}"
-
-            if not articles:
-                continue
-
-            section = f"""
-        <section id="{slug}" class="category-section">
-            <h2>{icon} {name}</h2>
-            <div class="article-grid">
-                {self._generate_article_cards(articles)}
-            </div>
-        </section>"""
-
-            sections.append(section)
-
-        return '\n'.join(sections)
-
-    def _generate_article_cards(
-        self,
-        articles: List[Dict[str, Any]],
-        is_highlight: bool = False
-    ) -> str:
-        """Generate HTML cards for articles"""
-        cards = []
-
-        for article in articles:
-            title = html_module.escape(article.get('title', ''))
-            summary = html_module.escape(article.get('summary', ''))
-            source = article.get('source', '')
-            url = article.get('url', '#')
-            score = article.get('score', 0)
-            score_label = html_module.escape(article.get('score_label', str(score)))
-
-            # Determine source badge class
-            source_class = self._get_source_class(source)
-
-            card_class = 'article-card highlight-card' if is_highlight else 'article-card'
-
-            card = f"""
-                <article class="{card_class}">
-                    <span class="source-badge {source_class}">{source}</span>
-                    <h3><a href="{url}" target="_blank" rel="noopener noreferrer">{title}</a></h3>
-                    <p class="summary">{summary}</p>
-                    <div class="card-meta">
-                        <span class="score">⭐ {score_label}</span>
-                        <a href="{url}" class="read-more" target="_blank" rel="noopener noreferrer">続きを読む →</a>
-                    </div>
-                </article>"""
-
-            cards.append(card)
-
-        return '\n                '.join(cards)
-
-    def _get_source_class(self, source: str) -> str:
-        """Get CSS class for source badge"""
-        source_map = {
-            'はてブ': 'hatena',
-            'Hacker News': 'hackernews',
-            'Reddit': 'reddit'
-        }
-        return source_map.get(source, 'other')
-
-    def _get_css(self) -> str:
-        """Get embedded CSS styles"""
-        return """    <style>
+            if i:
+                yield b'\n'
+            yield _SECTION_TMPL.format_map({
+                'slug': slug,
+                'icon': icon,
+                'source': source,
+                'article_count': article_count,
+                'html_summary': html_summary
+            }).encode('utf-8')
+
+    # Static CSS for digest page
+    _CSS: ClassVar[str] = """    <style>
         :root {
             --bg-primary: #ffffff;
             --bg-secondary: #f8f9fa;
@@ -591,9 +557,8 @@ class HTMLGenerator:
         }
     </style>"""
 
-    def _get_javascript(self) -> str:
-        """Get embedded JavaScript"""
-        return """    <script>
+    # Static JavaScript for digest page
+    _JS: ClassVar[str] = """    <script>
         // Dark mode toggle
         function toggleDarkMode() {
             document.body.classList.toggle('dark-mode');
@@ -644,3 +609,22 @@ class HTMLGenerator:
             observer.observe(article);
         });
     </script>"""
+
+
+# Static page fragments, encoded once at import time
+_HEAD_OPEN_BYTES = """<!DOCTYPE html>
+<html lang="ja">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>""".encode('utf-8')
+_CSS_BYTES = HTMLGenerator._CSS.encode('utf-8')
+_FOOTER_CLOSE_BYTES = """        <p>AI要約: Claude Haiku 4.5 (Anthropic) | <a href="archive.html">📚 アーカイブを見る</a></p>
+        <p class="disclaimer">このダイジェストはAIによって自動生成されています。</p>
+    </footer>
+
+    """.encode('utf-8')
+_JS_BYTES = HTMLGenerator._JS.encode('utf-8')
+_DOCUMENT_CLOSE_BYTES = b"""
+</body>
+</html>"""
@@ -3,14 +3,99 @@ AI Summarizer using Claude Haiku 4.5
 Categorizes and summarizes articles in Japanese
 """
 
-import anthropic
+import asyncio
+import hashlib
 import os
 import logging
-from typing import List, Dict, Any
+import time
+from typing import List, Dict, Any, Optional
 import json
+import orjson
+import re
+import types
+from collections import defaultdict
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
 
 logger = logging.getLogger(__name__)
 
+# Instructions shared by every summarization request. Together with
+# OUTPUT_SCHEMA it is sent as a cached system prompt, so repeated runs only pay
+# full price for the articles.
+STATIC_INSTRUCTIONS = """あなたは日本語でニュースダイジェストを作成するAIアシスタントです。ユーザーから渡される記事リストを分析し、ソース別（はてブ、Hacker News、Reddit）に分けて要約記事を作成してください。
+
+**重要な指示:**
+1. **ソース別に分割**: はてブ、Hacker News、Redditの3つのセクションに分けて要約を作成してください
+2. **各セクションの構成**:
+   - 各ソースごとに300-500文字程度の段落形式の要約
+   - そのソースの主要なトピックやトレンドを説明
+   - 記事へのリンクを自然に埋め込む（例: 「[記事タイトル](3)では...」）
+3. **全体サマリー**: 冒頭に全ソースを通しての今日の注目点を2-3段落（200-300文字）で記述
+4. **英語コンテンツの翻訳**: 英語の記事タイトルや内容は自然な日本語に翻訳してください
+5. **中立的なトーン**: 客観的で情報的なトーンを保ち、分析的な視点を加えてください
+6. **リンクの挿入**: Markdown形式 `[タイトル](記事番号)` で必ず記事リンクを含めてください。URLの代わりに記事リストの番号を書いてください"""
+
+# Output format shared by every summarization request, sent as a second cached
+# system block after STATIC_INSTRUCTIONS.
+OUTPUT_SCHEMA = """**出力形式:**
+JSON形式で以下の構造で出力してください:
+
+```json
+{
+  "title": "今日のダイジェストのタイトル（20文字以内）",
+  "overall_summary": "全体的な今日のトレンドや注目点（200-300文字、Markdown形式）",
+  "source_summaries": [
+    {
+      "source": "はてブ",
+      "icon": "📑",
+      "summary": "はてブからの記事の要約（300-500文字、リンク付きMarkdown形式）",
+      "article_count": 記事数
+    },
+    {
+      "source": "Hacker News",
+      "icon": "🔶",
+      "summary": "Hacker Newsからの記事の要約（300-500文字、リンク付きMarkdown形式）",
+      "article_count": 記事数
+    },
+    {
+      "source": "Reddit",
+      "icon": "🤖",
+      "summary": "Redditからの記事の要約（300-500文字、リンク付きMarkdown形式）",
+      "article_count": 記事数
+    }
+  ],
+  "key_topics": [
+    {
+      "topic": "トピック名",
+      "icon": "適切な絵文字"
+    }
+  ],
+  "total_articles": 記事の総数
+}
+```"""
+
+# Markdown link whose target is an article number from the prompt: [text](3)
+_ARTICLE_REF_RE = re.compile(r'\[([^\]]+)\]\((\d+)\)')
+
+# JSON payload, optionally wrapped in a markdown code fence with or without a
+# json tag in any case (```json, ```JSON). Either fence may be missing, as in a
+# response cut off before its closing fence.
+_JSON_FENCE_RE = re.compile(
+    r'^\s*(?:```(?:json)?)?\s*(.*?)\s*(?:```)?\s*$', re.DOTALL | re.IGNORECASE
+)
+
+# Icon shown next to each source, and the one used for any other source
+_SOURCE_ICONS = types.MappingProxyType({
+    'はてブ': '📑',
+    'Hacker News': '🔶',
+    'Reddit': '🤖'
+})
+_DEFAULT_ICON = '📰'
+
+# cache_control TTLs accepted by the Messages API
+PROMPT_CACHE_TTLS = ('5m', '1h')
+
 
 class AISummarizer:
     """Summarizes and categorizes articles using Claude AI"""
@@ -19,7 +104,15 @@ class AISummarizer:
         self,
         model: str = "claude-haiku-4-20250110",
         max_tokens: int = 4000,
-        temperature: float = 0.3
+        temperature: float = 0.3,
+        use_batch_api: bool = False,
+        batch_poll_interval: int = 60,
+        batch_timeout: int = 3600,
+        cache_dir: Optional[str] = None,
+        cache_ttl: int = 7 * 24 * 3600,
+        request_timeout: float = 120.0,
+        max_retries: int = 2,
+        prompt_cache_ttl: str = '5m'
     ):
         """
         Initialize AI summarizer
@@ -28,18 +121,85 @@ class AISummarizer:
             model: Claude model to use
             max_tokens: Maximum tokens for response
             temperature: Temperature for generation
+            use_batch_api: Submit requests via the Message Batches API (half price,
+                but results may take minutes to hours)
+            batch_poll_interval: Seconds between batch status checks
+            batch_timeout: Seconds to wait for a batch before giving up
+            cache_dir: Directory for cached summaries (None disables caching)
+            cache_ttl: Seconds a cached summary is kept before it is deleted
+            request_timeout: Seconds before an API request is abandoned
+            max_retries: Times the client retries a failed API request
+            prompt_cache_ttl: Lifetime of the cached system prompt, '5m' or '1h'.
+                Writing a 1h entry costs more, so it only pays off when runs
+                (or batch requests) are less than an hour but more than five
+                minutes apart
+
+        Raises:
+            ValueError: If prompt_cache_ttl is not '5m' or '1h'
         """
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
+        self.use_batch_api = use_batch_api
+        self.batch_poll_interval = batch_poll_interval
+        self.batch_timeout = batch_timeout
+        self.cache_dir = os.path.join(cache_dir, 'summary') if cache_dir else None
+        self.cache_ttl = cache_ttl
+        self.request_timeout = request_timeout
+        self.max_retries = max_retries
+        self.prompt_cache_ttl = prompt_cache_ttl
+
+        # Any other value makes every request fail with a 400
+        if prompt_cache_ttl not in PROMPT_CACHE_TTLS:
+            raise ValueError(f"prompt_cache_ttl must be '5m' or '1h', got {prompt_cache_ttl!r}")
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._prune_summary_cache()
+
+        # The Anthropic client is created on first use, so paths that never call
+        # the API (such as the fallback summary) skip importing the SDK
+        self._api_key = os.getenv('ANTHROPIC_API_KEY')
+        self._client = None
+        logger.info(f"AI Summarizer initialized with model: {model}")
 
-        # Initialize Anthropic client
-        api_key = os.getenv('ANTHROPIC_API_KEY')
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+    @property
+    def client(self):
+        """
+        Anthropic client, created on first access
 
-        self.client = anthropic.Anthropic(api_key=api_key)
-        logger.info(f"AI Summarizer initialized with model: {model}")
+        Raises:
+            ValueError: If ANTHROPIC_API_KEY is not set
+        """
+        if self._client is None:
+            if not self._api_key:
+                raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+
+            self._client = self._get_client(
+                self._api_key, self.request_timeout, self.max_retries
+            )
+        return self._client
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _get_client(api_key: str, timeout: float, max_retries: int):
+        """
+        Get the Anthropic client for an API key
+
+        Clients are shared between AISummarizer instances, so summarizers
+        created in the same process reuse one connection pool.
+
+        Args:
+            api_key: Anthropic API key
+            timeout: Seconds before a request is abandoned
+            max_retries: Times a failed request is retried
+
+        Returns:
+            anthropic.Anthropic client
+        """
+        import anthropic
+
+        return anthropic.Anthropic(api_key=api_key, timeout=timeout, max_retries=max_retries)
 
     def summarize_articles(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -53,29 +213,35 @@ class AISummarizer:
         """
         logger.info(f"Summarizing {len(articles)} articles...")
 
-        # Prepare article data for the prompt
-        article_list = self._format_articles_for_prompt(articles)
-
-        # Create the prompt
-        prompt = self._create_summary_prompt(article_list, len(articles))
+        cache_key = self._summary_cache_key(articles)
+        cached = self._load_cached_summary(cache_key)
+        if cached is not None:
+            logger.info("Using cached summary for this article set")
+            return cached
 
         try:
-            # Call Claude API
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
+            if self.use_batch_api:
+                batch_id = self.submit_batch(articles)
+                try:
+                    self.wait_for_batch(batch_id)
+                    summary_text = self._get_batch_text(batch_id)
+                except BaseException:
+                    # The result is about to be thrown away, so stop paying for it
+                    self._cancel_batch(batch_id)
+                    raise
+            else:
+                # Call Claude API, streaming the response so long generations
+                # keep the connection active instead of idling until the end
+                with self.client.messages.stream(
+                    **self._build_message_params(articles)
+                ) as stream:
+                    response = stream.get_final_message()
+                self._log_cache_usage(response.usage)
+                summary_text = response.content[0].text
 
             # Parse the response
-            summary_text = response.content[0].text
             result = self._parse_summary_response(summary_text, articles)
+            self._save_cached_summary(cache_key, result)
 
             logger.info(f"Successfully generated summary with {len(result.get('categories', []))} categories")
             return result
@@ -85,93 +251,284 @@ class AISummarizer:
             # Return a basic fallback structure
             return self._create_fallback_summary(articles)
 
-    def _format_articles_for_prompt(self, articles: List[Dict[str, Any]]) -> str:
+    def summarize_articles_many(
+        self,
+        buckets: List[List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
         """
-        Format articles for the AI prompt
+        Summarize several independent article sets concurrently
+
+        Each set gets its own request; the requests overlap on the network
+        instead of running one after another.
+
+        Args:
+            buckets: List of article lists, e.g. one per day
+
+        Returns:
+            Summary dictionaries in the same order as buckets
+
+        Raises:
+            ValueError: If ANTHROPIC_API_KEY is not set
+        """
+        logger.info(f"Summarizing {len(buckets)} article sets concurrently...")
+        return asyncio.run(self._summarize_many_async(buckets))
+
+    async def summarize_articles_async(
+        self,
+        articles: List[Dict[str, Any]],
+        client=None
+    ) -> Dict[str, Any]:
+        """
+        Summarize and categorize articles without blocking the event loop
+
+        Callers producing several digests can run these under asyncio.gather
+        so the requests overlap.
+
+        Args:
+            articles: List of article dictionaries from all sources
+            client: anthropic.AsyncAnthropic client to share between calls; a
+                temporary client is opened for this call when omitted
+
+        Returns:
+            Summary dictionary, or the fallback summary if the request fails
+
+        Raises:
+            ValueError: If no client is given and ANTHROPIC_API_KEY is not set
+        """
+        if client is None:
+            async with self._create_async_client() as client:
+                return await self.summarize_articles_async(articles, client)
+
+        cache_key = self._summary_cache_key(articles)
+        cached = self._load_cached_summary(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await client.messages.create(**self._build_message_params(articles))
+            self._log_cache_usage(response.usage)
+            result = self._parse_summary_response(response.content[0].text, articles)
+            self._save_cached_summary(cache_key, result)
+            return result
+
+        except Exception as e:
+            logger.error(f"Error generating summary: {e}")
+            return self._create_fallback_summary(articles)
+
+    async def _summarize_many_async(
+        self,
+        buckets: List[List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Summarize article sets concurrently over one shared async client
+
+        Args:
+            buckets: List of article lists
+
+        Returns:
+            Summary dictionaries in the same order as buckets
+        """
+        async with self._create_async_client() as client:
+            return await asyncio.gather(
+                *(self.summarize_articles_async(articles, client) for articles in buckets)
+            )
+
+    def _create_async_client(self):
+        """
+        Create an async Anthropic client
+
+        The client is bound to the running event loop, so callers open it with
+        async with and close it before the loop ends.
+
+        Returns:
+            New anthropic.AsyncAnthropic client
+
+        Raises:
+            ValueError: If ANTHROPIC_API_KEY is not set
+        """
+        if not self._api_key:
+            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+
+        import anthropic
+
+        return anthropic.AsyncAnthropic(
+            api_key=self._api_key,
+            timeout=self.request_timeout,
+            max_retries=self.max_retries
+        )
+
+    def submit_batch(self, articles: List[Dict[str, Any]]) -> str:
+        """
+        Submit the summarization request as a Message Batches job
+
+        Args:
+            articles: List of article dictionaries from all sources
+
+        Returns:
+            ID of the created batch
+        """
+        batch = self.client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": "digest",
+                    "params": self._build_message_params(articles)
+                }
+            ]
+        )
+        logger.info(f"Submitted summarization batch: {batch.id}")
+        return batch.id
+
+    def wait_for_batch(self, batch_id: str) -> None:
+        """
+        Poll a batch until it has finished processing
+
+        Args:
+            batch_id: ID of the batch to wait for
+
+        Raises:
+            TimeoutError: If the batch does not end within batch_timeout seconds
+        """
+        deadline = time.monotonic() + self.batch_timeout
+        while True:
+            batch = self.client.messages.batches.retrieve(batch_id)
+            if batch.processing_status == "ended":
+                return
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Batch {batch_id} did not finish within {self.batch_timeout} seconds"
+                )
+            logger.info(
+                f"Batch {batch_id} is {batch.processing_status}, "
+                f"checking again in {self.batch_poll_interval}s"
+            )
+            time.sleep(self.batch_poll_interval)
+
+    def _cancel_batch(self, batch_id: str) -> None:
+        """
+        Cancel a batch whose result will not be used
+
+        Failures are only logged, since the caller is already handling an error.
+
+        Args:
+            batch_id: ID of the batch to cancel
+        """
+        try:
+            self.client.messages.batches.cancel(batch_id)
+            logger.warning(f"Cancelled summarization batch: {batch_id}")
+        except Exception as e:
+            logger.warning(f"Error cancelling batch {batch_id}: {e}")
+
+    def _get_batch_text(self, batch_id: str) -> str:
+        """
+        Get the response text of a finished batch
+
+        Args:
+            batch_id: ID of an ended batch
+
+        Returns:
+            Text of the summarization response
+        """
+        for entry in self.client.messages.batches.results(batch_id):
+            if entry.result.type != "succeeded":
+                raise RuntimeError(f"Batch request {entry.custom_id} {entry.result.type}")
+            return entry.result.message.content[0].text
+
+        raise RuntimeError(f"Batch {batch_id} returned no results")
+
+    def _log_cache_usage(self, usage) -> None:
+        """
+        Log how much of the prompt was served from the prompt cache
+
+        Args:
+            usage: Usage object from a Messages API response
+        """
+        cache_read = getattr(usage, 'cache_read_input_tokens', None) or 0
+        cache_write = getattr(usage, 'cache_creation_input_tokens', None) or 0
+        logger.info(
+            f"Prompt cache: {cache_read} tokens read, {cache_write} tokens written, "
+            f"{usage.input_tokens} uncached input tokens"
+        )
+
+    def _build_message_params(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build the Messages API parameters for summarizing articles
 
         Args:
             articles: List of article dictionaries
 
         Returns:
-            Formatted string of articles
+            Keyword arguments for messages.create
         """
-        lines = []
-        for i, article in enumerate(articles, 1):
-            source = article.get('source', 'Unknown')
-            title = article.get('title', 'No title')
-            url = article.get('url', '')
-            score = article.get('score', 0)
-            score_label = article.get('score_label', f'{score}')
+        # Prepare article data for the prompt
+        article_list = self._format_articles_for_prompt(articles)
 
-            lines.append(f"{i}. [{source}] {title} ({score_label}) - {url}")
+        # Create the prompt
+        prompt = self._create_summary_prompt(article_list, len(articles))
 
-        return "\n".join(lines)
+        cache_control = {"type": "ephemeral", "ttl": self.prompt_cache_ttl}
 
-    def _create_summary_prompt(self, article_list: str, count: int) -> str:
+        return {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "system": [
+                {
+                    "type": "text",
+                    "text": STATIC_INSTRUCTIONS,
+                    "cache_control": cache_control
+                },
+                {
+                    "type": "text",
+                    "text": OUTPUT_SCHEMA,
+                    "cache_control": cache_control
+                }
+            ],
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        }
+
+    def _format_articles_for_prompt(self, articles: List[Dict[str, Any]]) -> str:
         """
-        Create the prompt for Claude
+        Format articles for the AI prompt
 
         Args:
-            article_list: Formatted article list
-            count: Number of articles
+            articles: List of article dictionaries
 
         Returns:
-            Complete prompt string
+            Formatted string of articles
         """
-        return f"""あなたは日本語でニュースダイジェストを作成するAIアシスタントです。以下の{count}件の記事を分析し、ソース別（はてブ、Hacker News、Reddit）に分けて要約記事を作成してください。
+        # Articles are referenced by number rather than URL to keep both the
+        # prompt and the response short; _resolve_article_links maps them back.
+        # Only fall back to the raw score when there is no score_label.
+        return "\n".join(
+            f"{i}. [{article.get('source', 'Unknown')}] {article.get('title', 'No title')} "
+            f"({article['score_label'] if 'score_label' in article else article.get('score', 0)})"
+            for i, article in enumerate(articles, 1)
+        )
 
-**重要な指示:**
-1. **ソース別に分割**: はてブ、Hacker News、Redditの3つのセクションに分けて要約を作成してください
-2. **各セクションの構成**:
-   - 各ソースごとに300-500文字程度の段落形式の要約
-   - そのソースの主要なトピックやトレンドを説明
-   - 記事へのリンクを自然に埋め込む（例: 「[記事タイトル](URL)では...」）
-3. **全体サマリー**: 冒頭に全ソースを通しての今日の注目点を2-3段落（200-300文字）で記述
-4. **英語コンテンツの翻訳**: 英語の記事タイトルや内容は自然な日本語に翻訳してください
-5. **中立的なトーン**: 客観的で情報的なトーンを保ち、分析的な視点を加えてください
-6. **リンクの挿入**: Markdown形式 `[タイトル](URL)` で必ず記事リンクを含めてください
+    def _create_summary_prompt(self, article_list: str, count: int) -> str:
+        """
+        Create the per-run user message for Claude
 
-**出力形式:**
-JSON形式で以下の構造で出力してください:
+        The instructions and output format live in STATIC_INSTRUCTIONS and
+        OUTPUT_SCHEMA so they can be served from the prompt cache; only the
+        articles change per run.
 
-```json
-{{
-  "title": "今日のダイジェストのタイトル（20文字以内）",
-  "overall_summary": "全体的な今日のトレンドや注目点（200-300文字、Markdown形式）",
-  "source_summaries": [
-    {{
-      "source": "はてブ",
-      "icon": "📑",
-      "summary": "はてブからの記事の要約（300-500文字、リンク付きMarkdown形式）",
-      "article_count": 記事数
-    }},
-    {{
-      "source": "Hacker News",
-      "icon": "🔶",
-      "summary": "Hacker Newsからの記事の要約（300-500文字、リンク付きMarkdown形式）",
-      "article_count": 記事数
-    }},
-    {{
-      "source": "Reddit",
-      "icon": "🤖",
-      "summary": "Redditからの記事の要約（300-500文字、リンク付きMarkdown形式）",
-      "article_count": 記事数
-    }}
-  ],
-  "key_topics": [
-    {{
-      "topic": "トピック名",
-      "icon": "適切な絵文字"
-    }}
-  ],
-  "total_articles": {count}
-}}
-```
+        Args:
+            article_list: Formatted article list
+            count: Number of articles
 
-**記事リスト:**
+        Returns:
+            User message content
+        """
+        return f"""**記事リスト（{count}件）:**
 {article_list}
 
-必ずJSON形式で出力してください。各ソースのsummaryフィールドには、記事へのリンクを含む段落形式の日本語要約を書いてください。"""
+必ずJSON形式で出力してください。total_articlesは{count}としてください。各ソースのsummaryフィールドには、記事へのリンクを含む段落形式の日本語要約を書いてください。"""
 
     def _parse_summary_response(
         self,
@@ -187,29 +544,21 @@ JSON形式で以下の構造で出力してください:
 
         Returns:
             Structured summary dictionary
+
+        Raises:
+            ValueError: If the response is not valid JSON or lacks required fields
         """
         try:
             # Try to extract JSON from response
             # Claude might wrap JSON in markdown code blocks
-            response_text = response_text.strip()
-
-            # Remove markdown code blocks if present
-            if response_text.startswith('```json'):
-                response_text = response_text[7:]
-            if response_text.startswith('```'):
-                response_text = response_text[3:]
-            if response_text.endswith('```'):
-                response_text = response_text[:-3]
-
-            response_text = response_text.strip()
+            response_text = _JSON_FENCE_RE.match(response_text).group(1)
 
             # Parse JSON
-            result = json.loads(response_text)
+            result = orjson.loads(response_text)
 
             # Validate structure for new format
             if 'overall_summary' not in result or 'source_summaries' not in result:
-                logger.warning("Missing required fields in response")
-                return self._create_fallback_summary(original_articles)
+                raise ValueError("Missing required fields in response")
 
             if 'title' not in result:
                 result['title'] = '今日のテックニュースダイジェスト'
@@ -220,12 +569,112 @@ JSON形式で以下の構造で出力してください:
             if 'total_articles' not in result:
                 result['total_articles'] = len(original_articles)
 
+            # Replace article-number links with the real URLs
+            result['overall_summary'] = self._resolve_article_links(
+                result['overall_summary'], original_articles
+            )
+            for source_summary in result['source_summaries']:
+                source_summary['summary'] = self._resolve_article_links(
+                    source_summary.get('summary', ''), original_articles
+                )
+
             return result
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing JSON response: {e}")
+        except json.JSONDecodeError:
             logger.debug(f"Response text: {response_text[:500]}")
-            return self._create_fallback_summary(original_articles)
+            raise
+
+    def _resolve_article_links(self, text: str, articles: List[Dict[str, Any]]) -> str:
+        """
+        Turn [text](N) article-number links into [text](url) markdown links
+
+        Args:
+            text: Markdown text from Claude
+            articles: Articles in prompt order (N is 1-based)
+
+        Returns:
+            Markdown with URLs filled in; links to unknown numbers become plain text
+        """
+        def replace(match: re.Match) -> str:
+            index = int(match.group(2)) - 1
+            if 0 <= index < len(articles) and articles[index].get('url'):
+                return f"[{match.group(1)}]({articles[index]['url']})"
+            return match.group(1)
+
+        return _ARTICLE_REF_RE.sub(replace, text)
+
+    def _summary_cache_key(self, articles: List[Dict[str, Any]]) -> str:
+        """
+        Build the cache key for summarizing a set of articles
+
+        Args:
+            articles: List of article dictionaries
+
+        Returns:
+            Hex digest identifying the model settings and article URLs
+        """
+        key_data = {
+            'model': self.model,
+            'temperature': self.temperature,
+            'urls': sorted(article.get('url', '') for article in articles)
+        }
+        return hashlib.sha256(json.dumps(key_data).encode('utf-8')).hexdigest()
+
+    def _load_cached_summary(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached summary
+
+        Args:
+            cache_key: Key from _summary_cache_key
+
+        Returns:
+            Cached summary dictionary, or None if not cached
+        """
+        if not self.cache_dir:
+            return None
+
+        path = os.path.join(self.cache_dir, f"{cache_key}.json")
+        try:
+            if time.time() - os.path.getmtime(path) >= self.cache_ttl:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_cached_summary(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """
+        Save a summary to the cache
+
+        Args:
+            cache_key: Key from _summary_cache_key
+            result: Parsed summary dictionary
+        """
+        if not self.cache_dir:
+            return
+
+        path = os.path.join(self.cache_dir, f"{cache_key}.json")
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"Error caching summary: {e}")
+
+    def _prune_summary_cache(self) -> None:
+        """
+        Delete cached summaries older than cache_ttl
+
+        Every distinct article set gets its own cache file, so without pruning
+        the directory grows by a file or more per run.
+        """
+        cutoff = time.time() - self.cache_ttl
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+        except OSError as e:
+            logger.warning(f"Error pruning summary cache: {e}")
 
     def _create_fallback_summary(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -239,42 +688,53 @@ JSON形式で以下の構造で出力してください:
         """
         logger.warning("Creating fallback summary")
 
-        # Sort by score
-        sorted_articles = sorted(articles, key=lambda x: x.get('score', 0), reverse=True)
-
-        # Group by source
-        by_source = {}
-        for article in sorted_articles:
-            source = article.get('source', 'その他')
-            if source not in by_source:
-                by_source[source] = []
-            by_source[source].append(article)
+        # Read each article's fields once as (score, source, title, url, position)
+        entries = [
+            (
+                article.get('score', 0),
+                article.get('source', 'その他'),
+                article.get('title', ''),
+                article.get('url', ''),
+                position
+            )
+            for position, article in enumerate(articles)
+        ]
+
+        # Group by source in a single pass
+        by_source = defaultdict(list)
+        for entry in entries:
+            by_source[entry[1]].append(entry)
+
+        # Only the ten best articles per source are listed, so pick them with
+        # nlargest (which breaks ties in input order, like a stable sort)
+        # instead of sorting every article
+        top_by_source = {
+            source: nlargest(10, source_entries, key=itemgetter(0))
+            for source, source_entries in by_source.items()
+        }
 
         # Create overall summary
         overall_summary = f"今日は全体で{len(articles)}件の記事を収集しました。\n\n主なトピックは、テクノロジー、AI、プログラミングなどです。"
 
         # Create source summaries
         source_summaries = []
-        source_icons = {
-            'はてブ': '📑',
-            'Hacker News': '🔶',
-            'Reddit': '🤖'
-        }
 
-        for source, source_articles in by_source.items():
-            summary_parts = []
-            for i, article in enumerate(source_articles[:10], 1):
-                title = article.get('title', '')
-                url = article.get('url', '')
-                summary_parts.append(f"[{title}]({url})")
-                if i < len(source_articles[:10]):
-                    summary_parts.append("、")
+        # List sources by their best-scoring article, breaking ties by that
+        # article's position in the input as a stable sort by score would
+        def best_article_rank(source):
+            score, _, _, _, position = top_by_source[source][0]
+            return -score, position
 
-            summary_text = f"{source}からは{len(source_articles)}件の記事があります。主な記事: " + "".join(summary_parts)
+        for source in sorted(by_source, key=best_article_rank):
+            source_articles = by_source[source]
+            top_articles = top_by_source[source]
+            article_links = "、".join(f"[{title}]({url})" for _, _, title, url, _ in top_articles)
+
+            summary_text = f"{source}からは{len(source_articles)}件の記事があります。主な記事: " + article_links
 
             source_summaries.append({
                 'source': source,
-                'icon': source_icons.get(source, '📰'),
+                'icon': _SOURCE_ICONS.get(source, _DEFAULT_ICON),
                 'summary': summary_text,
                 'article_count': len(source_articles)
             })
@@ -289,12 +749,3 @@ JSON形式で以下の構造で出力してください:
             ],
             'total_articles': len(articles)
         }
-
-    def _get_source_icon(self, source: str) -> str:
-        """Get icon emoji for source"""
-        icons = {
-            'はてブ': '📑',
-            'Hacker News': '🔶',
-            'Reddit': '🤖'
-        }
-        return icons.get(source, '📰')